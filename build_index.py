@@ -0,0 +1,130 @@
+"""
+
+    Icelandic LLM evaluation data generator: BÍN index builder
+
+    Copyright (C) 2023 Miðeind ehf.
+    All rights reserved.
+
+    This utility program looks up the lemmas of the nouns.csv and
+    adjectives.csv files in the BÍN database (encapsulated in
+    islenska), once, and stores the results as three pickled
+    indexes in the data directory:
+
+    * bin_by_form.pkl maps each word form to a list of
+      (lemma, category) tuples,
+    * bin_by_lemma.pkl maps each lemma to a list of
+      (word form, category) tuples, for those entries returned by
+      b.lookup(lemma) that belong to the lemma itself. These are
+      only the forms spelled like the lemma (e.g. "hestur" for
+      the nominative singular of "hestur"), not its full inflection
+      paradigm: this mirrors the original scoring, which summed
+      the frequencies of exactly these word forms, and
+    * bin_lemma_cats.pkl maps each lemma to the list of categories
+      of its entries as returned by islenska's Bin.lookup_lemmas().
+
+    calc-freq.py reads these indexes when processing nouns and
+    adjectives, instead of querying BÍN afresh on every run.
+    Each index is stored along with a signature of its inputs, i.e.
+    the islenska version and a hash of each input file, and
+    calc-freq.py refuses to use an index whose signature does not
+    match the current inputs.
+
+    Usage
+    -----
+
+    ```bash
+        python build_index.py
+    ```
+
+"""
+
+from typing import Any, Dict, Iterator, List, Tuple
+
+import csv
+import hashlib
+import pickle
+
+from pathlib import Path
+
+import islenska
+
+# A word form entry: (lemma, category)
+FormEntry = Tuple[str, str]
+# A lemma entry: (word form, category), for the word forms
+# that are spelled like the lemma (see bin_by_lemma.pkl above)
+LemmaEntry = Tuple[str, str]
+
+DATA_PATH = Path("data")
+
+# The input files whose lemmas are indexed, within the data directory
+INPUT_FILES: Tuple[str, ...] = ("nouns.csv", "adjectives.csv")
+
+# File names of the indexes, within the data directory
+FORM_INDEX = "bin_by_form.pkl"
+LEMMA_INDEX = "bin_by_lemma.pkl"
+LEMMA_CATS_INDEX = "bin_lemma_cats.pkl"
+
+
+def lemma_generator() -> Iterator[str]:
+    """Return a generator to loop through the lemmas
+    of the noun and adjective input files"""
+    for name in INPUT_FILES:
+        with open(DATA_PATH / name, "r", encoding="utf-8", newline="") as inp:
+            for row in csv.reader(inp):
+                if row and row[0]:
+                    yield row[0]
+
+
+def source_signature() -> Dict[str, str]:
+    """Return a signature of the inputs that the indexes are built from,
+    i.e. the islenska version and a hash of each input file"""
+    signature = {"islenska": islenska.__version__}
+    for name in INPUT_FILES:
+        with open(DATA_PATH / name, "rb") as inp:
+            signature[name] = hashlib.sha256(inp.read()).hexdigest()
+    return signature
+
+
+def dump_index(name: str, signature: Dict[str, str], index: Any) -> None:
+    """Write an index, along with the signature of its inputs, to a file"""
+    with open(DATA_PATH / name, "wb") as out:
+        pickle.dump((signature, index), out, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def build_index() -> None:
+    """Look up all lemmas and their word forms in BÍN,
+    and write the resulting indexes to files"""
+    b = islenska.Bin()
+    signature = source_signature()
+    by_form: Dict[str, List[FormEntry]] = {}
+    by_lemma: Dict[str, List[LemmaEntry]] = {}
+    lemma_cats: Dict[str, List[str]] = {}
+
+    # Look up each distinct lemma, noting the word forms
+    # that BÍN returns for it
+    for lemma in lemma_generator():
+        if lemma in by_lemma:
+            continue
+        _, entries = b.lookup(lemma)
+        by_form[lemma] = [(e.ord, e.ofl) for e in entries]
+        # Only the entries of the lemma's own spelling, not its full
+        # paradigm, which is what scoring has always been based on
+        by_lemma[lemma] = [(e.bmynd, e.ofl) for e in entries if e.ord == lemma]
+        # Let islenska decide which of the entries describe the word as a lemma
+        _, entries = b.lookup_lemmas(lemma)
+        lemma_cats[lemma] = [e.ofl for e in entries]
+
+    # Then look up those word forms that are not lemmas themselves
+    for forms in by_lemma.values():
+        for wf, _ in forms:
+            if wf not in by_form:
+                _, entries = b.lookup(wf)
+                by_form[wf] = [(e.ord, e.ofl) for e in entries]
+
+    dump_index(FORM_INDEX, signature, by_form)
+    dump_index(LEMMA_INDEX, signature, by_lemma)
+    dump_index(LEMMA_CATS_INDEX, signature, lemma_cats)
+
+
+if __name__ == "__main__":
+    build_index()
@@ -20,12 +20,26 @@
 
     ```bash
     psql> \\copy (select ord, ofl from bin2023
-        where ofl in ('kk', 'kvk', 'hk')) to 'data/nouns.csv' with csv;
+        where ofl in ('kk', 'kvk', 'hk') and ord !~ '^[[:upper:]]')
+        to 'data/nouns.csv' with csv;
 
     psql> \\copy (select ord from bin2023 where ofl = 'lo')
         to 'data/adjectives.csv' with csv;
     ```
 
+    The noun query leaves out proper nouns, i.e. lemmas starting with
+    an uppercase letter. Its [[:upper:]] class depends on the database's
+    LC_CTYPE, which must be a UTF-8 locale that knows Icelandic letters
+    (such as is_IS.UTF-8) for initials like Á, Ð and Þ to be recognized.
+
+    Next, the BÍN database is queried once for the lemmas in
+    those files, and the results stored as indexes in the data
+    directory:
+
+    ```bash
+        python build_index.py
+    ```
+
     Then, given those files, this program is run to generate
     randomly sampled, bucketed lists of nouns and adjectives
     respectively. The buckets are created by frequency of
@@ -39,10 +53,12 @@
     ```
 
     Finally, after the buckets 0-2 have been created, the
-    final evaluation samples can be generated:
+    final evaluation samples can be generated. The samples are
+    drawn using a fixed random seed, 2023 by default, so the
+    output is reproducible; pass --seed to draw a different set:
 
     ```bash
-        python calc-freq.py --generate
+        python calc-freq.py --generate [N] [--seed SEED]
     ```
 
     The results are found in the
@@ -50,20 +66,45 @@
 
 """
 
+import csv
 import functools
+import itertools
 import json
-from typing import IO, Dict, Iterator, List, Mapping, Set, Tuple, FrozenSet
+import multiprocessing
+import pickle
+from typing import (
+    IO,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    FrozenSet,
+)
 
 import random
-import math
 
 from collections import defaultdict
-from pathlib import Path
 
 import icegrams
 import islenska
 from reynir import NounPhrase
 
+from build_index import (
+    DATA_PATH,
+    FORM_INDEX,
+    LEMMA_CATS_INDEX,
+    LEMMA_INDEX,
+    FormEntry,
+    LemmaEntry,
+    source_signature,
+)
+
 NounTuple = Tuple[str, str]
 
 # Pesky lemmas that seem to get through frequency filtering by
@@ -73,36 +114,49 @@ AVOID_NOUNS: FrozenSet[str] = frozenset(["nam", "góða", "ex", "virt", "óþör
 
 MAX_BUCKETS = 3
 
+GENDERS: Tuple[str, ...] = ("kk", "kvk", "hk")
+
 NUM_NOUN_SAMPLES = 1000
 NUM_ADJECTIVE_SAMPLES = 500
 
-DATA_PATH = Path("data")
+# Number of lemmas sent to a worker process in each scoring task
+BATCH_SIZE = 256
+
+# Error message for BÍN indexes that do not match their input files
+INDEX_OUT_OF_DATE = "index out of date; rerun 'python build_index.py'"
+
+# Default seed for sampling lemmas when generating the output files
+RANDOM_SEED = 2023
 
 DIFFICULTY: Mapping[int, str] = {0: "hard", 1: "medium", 2: "easy"}
 
 # Instantiate the icegrams database of unigram, bigram and trigram frequencies
 ngrams = icegrams.ngrams.Ngrams()
 
-# Instantiate the BÍN database of inflectional forms
+# Common word forms recur across many lemmas, so memoize the frequency lookups
+cached_freq = functools.lru_cache(maxsize=200000)(ngrams.freq)
+
+# Instantiate the BÍN database of inflectional forms, which is used
+# to look up the inflection variants of the lemmas that are written
+# to the output buckets
 b = islenska.Bin()
 
 # Read the data/nouns.csv file, which contains a list of noun lemmas.
-# Look up each lemma in the BIN database (encapsulated in islenska),
-# find all of its word forms, and look each wordform up in the icegrams
-# database. Sum up the number of occurrences and store the lemma in
+# Look up each lemma in the BÍN indexes created by build_index.py,
+# find its word forms that are spelled like the lemma itself, and look
+# each wordform up in the icegrams database. Sum up the number of occurrences and store the lemma in
 # the appropriate output bucket by frequency.
 
 
-def file(name: str, mode: str) -> IO[str]:
-    return open(DATA_PATH / name, mode, encoding="utf-8")
+def file(name: str, mode: str, newline: Optional[str] = None) -> IO[str]:
+    return open(DATA_PATH / name, mode, encoding="utf-8", newline=newline)
 
 
 def bucket(freq: int) -> int:
     """Return the bucket number for a given frequency, using powers of 10"""
-    if freq <= 1:
-        return 0
-    # We only need buckets 0 through MAX_BUCKETS-1
-    return min(MAX_BUCKETS - 1, int(math.log10(freq)))
+    # We only need buckets 0 through MAX_BUCKETS-1, i.e. frequencies
+    # below 10, from 10 to 99, and 100 or more
+    return (freq >= 10) + (freq >= 100)
 
 
 class Buckets:
@@ -111,112 +165,253 @@ class Buckets:
 
     def __init__(self, name: str) -> None:
         self.name = name
-        self.buckets: Dict[int, Set[str]] = defaultdict(set)
+        self.buckets: Dict[int, List[str]] = defaultdict(list)
         self.lemmas: Dict[int, List[str]] = defaultdict(list)
+        # Metadata about each lemma, such as its gender and
+        # inflection variants, keyed by bucket and lemma
+        self.meta: Dict[int, Dict[str, Dict[str, Any]]] = defaultdict(dict)
 
-    def add(self, lemma: str, freq: int) -> None:
-        """Add a lemma and its frequency to the appropriate bucket"""
+    def add(self, lemma: str, freq: int, meta: Optional[Dict[str, Any]] = None) -> None:
+        """Add a lemma, its frequency and optional metadata
+        to the appropriate bucket"""
         # Find the bucket number
         b = bucket(freq)
-        self.buckets[b].add(lemma)
-
-    def write(self, limit: int) -> None:
+        self.buckets[b].append(lemma)
+        self.meta[b][lemma] = meta or {}
+
+    def write(
+        self,
+        limit: int,
+        describe: Callable[[str, Dict[str, Any]], Optional[Dict[str, Any]]],
+    ) -> None:
         """Sample the given number of lemmas from the buckets
-        and write the samples to files, one file per bucket"""
+        and write the samples, along with their metadata, to
+        JSONL files, one file per bucket. The describe function
+        is called with each sampled lemma and its metadata, and
+        returns the complete metadata to write, or None if the
+        lemma is not usable after all."""
         for bucket, lemmas in self.buckets.items():
             if len(lemmas) < 1:
                 continue
-            with file(f"{self.name}-{bucket}.txt", "w") as out:
-                llist = list(lemmas)
-                samples = min(limit, len(llist))
-                for lemma in random.sample(llist, samples):
-                    out.write(f"{lemma}\n")
+            # Remove any duplicates, and walk through the lemmas in random
+            # order, describing only as many as are needed to fill the sample
+            lemmas = list(dict.fromkeys(lemmas))
+            random.shuffle(lemmas)
+            meta = self.meta[bucket]
+            records: List[str] = []
+            for lemma in lemmas:
+                if (m := describe(lemma, meta[lemma])) is not None:
+                    records.append(
+                        json.dumps({"lemma": lemma, **m}, ensure_ascii=False)
+                    )
+                    if len(records) >= limit:
+                        break
+            if not records:
+                # None of the lemmas in this bucket was usable
+                continue
+            with file(f"{self.name}-{bucket}.jsonl", "w") as out:
+                out.write("\n".join(records) + "\n")
 
     def read(self, bucket: int) -> None:
         """Read the contents of a bucket back from its file"""
         try:
             bu = self.lemmas[bucket]
-            with file(f"{self.name}-{bucket}.txt", "r") as inp:
+            meta = self.meta[bucket]
+            with file(f"{self.name}-{bucket}.jsonl", "r") as inp:
                 for line in inp:
                     if line := line.strip():
-                        bu.append(line)
+                        record = json.loads(line)
+                        lemma = record.pop("lemma")
+                        bu.append(lemma)
+                        meta[lemma] = record
         except FileNotFoundError:
             # No lemmas found for this bucket
             assert len(self.lemmas[bucket]) == 0
 
-    def choose(self, bucket: int) -> str:
-        """Choose a lemma at random from the specified bucket"""
+    def sample(
+        self, bucket: int, k: int, rng: random.Random
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        """Choose k lemmas at random, with replacement, from the specified
+        bucket, returning them along with their metadata"""
         if bucket not in self.lemmas:
             # Read the bucket from its file
             self.read(bucket)
-        # Return a random lemma from the bucket
-        return random.choice(self.lemmas[bucket])
+        lemmas = self.lemmas[bucket]
+        if not lemmas:
+            # The bucket file is missing or empty
+            raise RuntimeError(
+                f"No lemmas to sample in {DATA_PATH / f'{self.name}-{bucket}.jsonl'}"
+            )
+        meta = self.meta[bucket]
+        return [(lemma, meta[lemma]) for lemma in rng.choices(lemmas, k=k)]
 
 
 def noun_generator() -> Iterator[NounTuple]:
     """Return a generator to loop through the noun input file"""
-    with file("nouns.csv", "r") as inp:
-        for line in inp:
+    with file("nouns.csv", "r", newline="") as inp:
+        for row in csv.reader(inp):
             # Yield the noun lemma and the gender (kk, kvk, hk)
-            if line := line.strip():
-                n = line.split(",")
-                if len(n) == 2:
-                    lemma, gender = n[0], n[1]
-                    if lemma[0].isupper():
-                        # Skip proper nouns
-                        continue
-                    if "-" in lemma or " " in lemma or "." in lemma:
-                        # Skip nouns with hyphens or spaces (these can occur in BÍN)
-                        continue
-                    yield (lemma, gender)
+            if len(row) == 2:
+                lemma, gender = row[0], row[1]
+                if "-" in lemma or " " in lemma or "." in lemma:
+                    # Skip nouns with hyphens or spaces (these can occur in BÍN)
+                    continue
+                yield (lemma, gender)
 
 
 def adjective_generator() -> Iterator[str]:
     """Return a generator to loop through the adjective input file"""
-    with file("adjectives.csv", "r") as inp:
-        for line in inp:
+    with file("adjectives.csv", "r", newline="") as inp:
+        for row in csv.reader(inp):
             # Yield the adjective lemma
-            if lemma := line.strip():
+            if row and (lemma := row[0]):
                 if "-" in lemma or " " in lemma or "." in lemma:
                     continue
                 yield lemma
 
 
+def load_pickle(name: str) -> Any:
+    """Load a pickled index from a file in the data directory,
+    checking that it was built from the current input files"""
+    try:
+        with open(DATA_PATH / name, "rb") as inp:
+            data = pickle.load(inp)
+    except FileNotFoundError as e:
+        raise FileNotFoundError(
+            f"{DATA_PATH / name} not found; run 'python build_index.py' first"
+        ) from e
+    # The index is stored along with the signature of its inputs
+    if not (isinstance(data, tuple) and data[0] == current_signature()):
+        raise RuntimeError(f"{DATA_PATH / name}: {INDEX_OUT_OF_DATE}")
+    return data[1]
+
+
+@functools.lru_cache(maxsize=None)
+def current_signature() -> Dict[str, str]:
+    """Return the signature of the current inputs of the BÍN indexes"""
+    return source_signature()
+
+
+@functools.lru_cache(maxsize=None)
+def bin_by_form() -> Dict[str, List[FormEntry]]:
+    """Return the word form index of BÍN, as created by build_index.py"""
+    return load_pickle(FORM_INDEX)
+
+
+@functools.lru_cache(maxsize=None)
+def bin_by_lemma() -> Dict[str, List[LemmaEntry]]:
+    """Return the lemma index of BÍN, as created by build_index.py"""
+    return load_pickle(LEMMA_INDEX)
+
+
+@functools.lru_cache(maxsize=None)
+def bin_lemma_cats() -> Dict[str, List[str]]:
+    """Return the categories of the BÍN lemma entries of each lemma,
+    as found by islenska's Bin.lookup_lemmas() in build_index.py"""
+    return load_pickle(LEMMA_CATS_INDEX)
+
+
+def bulk_lookup(words: Iterable[str]) -> Dict[str, List[FormEntry]]:
+    """Look up each distinct word in the BÍN word form index, returning
+    a dict of word -> list of (lemma, category) entries"""
+    by_form = bin_by_form()
+    try:
+        return {word: by_form[word] for word in words}
+    except KeyError as e:
+        # The index covers all word forms of the indexed lemmas
+        raise RuntimeError(
+            f"{e.args[0]!r} not in BÍN index: {INDEX_OUT_OF_DATE}"
+        ) from e
+
+
+def score_lemmas(candidates: List[NounTuple]) -> List[Tuple[str, str, int]]:
+    """Return (lemma, category, frequency) tuples for those (lemma, category)
+    candidates that are unambiguous in BÍN, batching the lookups of all
+    lemmas and word forms involved"""
+    # Only keep lemmas that have a single meaning in the BÍN database
+    lemma_cats = bin_lemma_cats()
+    lemmas: List[NounTuple] = []
+    for lemma, cat in candidates:
+        if lemma not in lemma_cats:
+            # The index covers all lemmas of the input files
+            raise RuntimeError(f"{lemma!r} not in BÍN index: {INDEX_OUT_OF_DATE}")
+        if lemma_cats[lemma] == [cat]:
+            lemmas.append((lemma, cat))
+
+    by_lemma = bin_by_lemma()
+    wordforms: Dict[str, Set[str]] = {
+        lemma: set(bmynd for bmynd, ofl in by_lemma[lemma] if ofl == cat)
+        for lemma, cat in lemmas
+    }
+    # Look up the union of the word forms of those lemmas in one pass
+    entries = bulk_lookup(wf for w in wordforms.values() for wf in w)
+
+    # Build a reverse index of each word form to its distinct
+    # (lemma, category) tuples, from the entries already looked up
+    form_map: Dict[str, Set[NounTuple]] = {wf: set(es) for wf, es in entries.items()}
+
+    scored: List[Tuple[str, str, Set[str]]] = []
+    for lemma, cat in lemmas:
+        w = wordforms[lemma]
+        unambiguous = {(lemma, cat)}
+        for wf in w:
+            if form_map[wf] != unambiguous:
+                # Skip lemmas that are ambiguous, i.e. whose word forms can
+                # belong to other lemmas, stopping at the first such form
+                break
+        else:
+            scored.append((lemma, cat, w))
+
+    # Look up the frequency of each distinct word form of the
+    # remaining lemmas once, and then sum them up per lemma
+    all_forms = set(itertools.chain.from_iterable(w for _, _, w in scored))
+    freqs = dict(zip(all_forms, map(cached_freq, all_forms)))
+    return [(lemma, cat, sum(map(freqs.__getitem__, w))) for lemma, cat, w in scored]
+
+
+def batches(
+    candidates: Iterable[NounTuple], size: int = BATCH_SIZE
+) -> Iterator[List[NounTuple]]:
+    """Split a stream of candidates into lists of at most the given size"""
+    it = iter(candidates)
+    while batch := list(itertools.islice(it, size)):
+        yield batch
+
+
+def score_all(candidates: Iterable[NounTuple]) -> Iterator[Tuple[str, str, int]]:
+    """Score candidate lemmas in parallel, one batch per worker task.
+    The lemmas are independent of each other, so the order in which
+    the results arrive does not matter."""
+    # Load the BÍN indexes up front, so that forked workers inherit them
+    # instead of loading their own copies. Each worker has its own
+    # (memory-mapped) icegrams instance, either inherited when forked
+    # or created when it imports this module.
+    bin_by_form()
+    bin_by_lemma()
+    bin_lemma_cats()
+    with multiprocessing.Pool() as pool:
+        for scored in pool.imap_unordered(score_lemmas, batches(candidates)):
+            yield from scored
+
+
 def process_nouns() -> None:
     """Process noun lemmas"""
     # Create the output buckets
     noun_buckets = Buckets("nouns")
-    # Loop over the lemmas
-    for lemma, gender in noun_generator():
-        # Look up the lemma in the BIN database
-        _, forms = b.lookup_lemmas(lemma)
-        if len(forms) != 1 or forms[0].ofl != gender:
-            # Skip nouns that have multiple lemmas/meanings
-            continue
-
-        _, forms = b.lookup(lemma)
-        w = set(f.bmynd for f in forms if f.ord == lemma and f.ofl == gender)
-        if any(
-            any(e.ofl != gender or e.ord != lemma for e in b.lookup(wf)[1]) for wf in w
-        ):
-            # Skip lemmas that are ambiguous, i.e. whose word forms can
-            # belong to other lemmas
-            continue
-
-        # Loop over the distinct wordforms and sum their frequency
-        freq = sum(ngrams.freq(wordform) for wordform in w)
-
+    # Loop over the unambiguous lemmas and their frequencies
+    for lemma, gender, freq in score_all(noun_generator()):
         # Write the lemma and the frequency to the appropriate bucket
-        noun_buckets.add(lemma, freq)
+        noun_buckets.add(lemma, freq, {"gender": gender})
 
-    # Done: write the result buckets to files
-    noun_buckets.write(NUM_NOUN_SAMPLES)
+    # Done: write the result buckets to files, looking up
+    # the plural forms of the sampled nouns along the way
+    noun_buckets.write(NUM_NOUN_SAMPLES, noun_meta)
 
 
 def process_adjectives() -> None:
     """Process adjective lemmas"""
     adj_buckets = Buckets("adj")
-    # Loop over the lemmas
+    candidates: List[NounTuple] = []
     for lemma in adjective_generator():
         # Skip adjectives ending with "-legur" - they are
         # all the same for our purposes
@@ -224,32 +419,88 @@ def process_adjectives() -> None:
             continue
         if lemma in AVOID_ADJECTIVES:
             continue
-        # Look up the lemma in the BIN database
-        _, forms = b.lookup_lemmas(lemma)
-        if len(forms) != 1 or forms[0].ofl != "lo":
-            continue
-
-        _, forms = b.lookup(lemma)
-        w = set(f.bmynd for f in forms if f.ord == lemma and f.ofl == "lo")
-
-        if any(
-            any(e.ofl != "lo" or e.ord != lemma for e in b.lookup(wf)[1]) for wf in w
-        ):
-            # Skip lemmas that are ambiguous, i.e. whose word forms can
-            # belong to other lemmas
-            continue
-
-        # Loop over the distinct wordforms, summing up the frequencies
-        freq = sum(ngrams.freq(wordform) for wordform in w)
+        candidates.append((lemma, "lo"))
 
+    # Loop over the unambiguous lemmas and their frequencies
+    for lemma, _, freq in score_all(candidates):
         # Write the lemma and the frequency to the output file
         adj_buckets.add(lemma, freq)
 
-    # Done: write the result buckets to files
-    adj_buckets.write(NUM_ADJECTIVE_SAMPLES)
-
-
-def generate(count: int) -> None:
+    # Done: write the result buckets to files, looking up
+    # the inflection variants of the sampled adjectives along the way
+    adj_buckets.write(NUM_ADJECTIVE_SAMPLES, adjective_meta)
+
+
+def adjective_variants(adj_lemma: str) -> Optional[Dict[str, Dict[str, str]]]:
+    """Return a dict of gender -> {"et": singular, "ft": plural} base strong
+    forms of an adjective, or None if any of those forms is missing from BÍN"""
+    forms: Dict[str, Dict[str, str]] = {}
+    for gender in GENDERS:
+        et = b.lookup_variants(adj_lemma, "lo", (gender.upper(), "FSB", "NF", "ET"))
+        ft = b.lookup_variants(adj_lemma, "lo", (gender.upper(), "FSB", "NF", "FT"))
+        if not et or not ft:
+            return None
+        forms[gender] = {"et": et[0].bmynd, "ft": ft[0].bmynd}
+    return forms
+
+
+def noun_variants(noun: str, gender: str) -> Optional[str]:
+    """Return the plural form of a noun of the given gender,
+    or None if the noun has no plural form in BÍN"""
+    ft = b.lookup_variants(noun, gender, ("NF", "FT"))
+    if not ft:
+        # The noun probably does not exist in plural form
+        return None
+    # The lookup-variants function may return a hyphenated form
+    # for composite words; we don't want that
+    return ft[0].bmynd.replace("-", "")
+
+
+def noun_meta(noun: str, meta: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Return the metadata to store with a noun in its bucket file, i.e.
+    its gender and its plural form, or None if the plural is missing"""
+    noun_ft = noun_variants(noun, meta["gender"])
+    if noun_ft is None:
+        return None
+    return {**meta, "variants": {"ft": noun_ft}}
+
+
+def adjective_meta(adj_lemma: str, meta: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Return the metadata to store with an adjective in its bucket file,
+    i.e. its inflection variants, or None if any of them is missing"""
+    adj_variants = adjective_variants(adj_lemma)
+    if adj_variants is None:
+        return None
+    return {**meta, "variants": adj_variants}
+
+
+@functools.lru_cache(maxsize=None)
+def build_completion(
+    adj: str, adj_ft: str, noun: str, noun_ft: str
+) -> Dict[str, Dict[str, str]]:
+    """Return the complete inflection of a noun phrase, given the
+    singular and plural forms of its adjective and noun. The result
+    is cached since parsing the noun phrases is relatively slow."""
+    # Create a noun phrase in singular and plural forms
+    nl = NounPhrase(f"{adj} {noun}", force_number="et")
+    nl_ft = NounPhrase(f"{adj_ft} {noun_ft}", force_number="ft")
+    return {
+        "et": {  # Singular
+            "nf": f"{nl:nf}",  # Nominative
+            "þf": f"{nl:þf}",  # Accusative
+            "þgf": f"{nl:þgf}",  # Dative
+            "ef": f"{nl:ef}",  # Genitive
+        },
+        "ft": {  # Plural
+            "nf": f"{nl_ft:nf}",
+            "þf": f"{nl_ft:þf}",
+            "þgf": f"{nl_ft:þgf}",
+            "ef": f"{nl_ft:ef}",
+        },
+    }
+
+
+def generate(count: int, seed: int = RANDOM_SEED) -> None:
     """Generate JSONL output files"""
     # Generate three output files, with varying degree of difficulty
     # from buckets 0, 1 and 2, by combining an adjective from bucket N
@@ -257,53 +508,26 @@ def generate(count: int) -> None:
     adj_buckets = Buckets("adj")
     noun_buckets = Buckets("nouns")
     jdump = functools.partial(json.dumps, ensure_ascii=False)
+    # Use a seeded random number generator, for reproducible output
+    rng = random.Random(seed)
     for bucket in range(MAX_BUCKETS):
-        # Read the adjective and noun buckets from file
         # Open the output file
         outputPath = DATA_PATH / f"icelandic-inflection-{DIFFICULTY[bucket]}"
         outputPath.mkdir(exist_ok=True)
         with open(outputPath / "samples.jsonl", "w", encoding="utf-8") as out:
-            c = 0
-            while c < count:
-                # Choose an adjective and a noun from the bucket
-                adj_lemma = adj_buckets.choose(bucket)
-                noun = noun_buckets.choose(bucket)
-                gender = b.lookup(noun)[1][0].ofl
-                # Find the base strong form of the adjective for the correct gender
-                adj = b.lookup_variants(
-                    adj_lemma, "lo", (gender.upper(), "FSB", "NF", "ET")
-                )[0].bmynd
-                adj_ft = b.lookup_variants(
-                    adj_lemma, "lo", (gender.upper(), "FSB", "NF", "FT")
-                )[0].bmynd
-                try:
-                    # Find the plural form of the noun
-                    noun_ft = b.lookup_variants(noun, gender, ("NF", "FT"))[0].bmynd
-                    # The lookup-variants function may return a hyphenated form
-                    # for composite words; we don't want that
-                    noun_ft = noun_ft.replace("-", "")
-                except IndexError:
-                    # The noun probably does not exist in plural form
-                    continue
-                # Write the JSONL record to the output file
-                # Create a noun phrase in singular and plural forms
-                nl = NounPhrase(f"{adj} {noun}", force_number="et")
-                nl_ft = NounPhrase(f"{adj_ft} {noun_ft}", force_number="ft")
+            # Choose all the adjectives and nouns for the samples from
+            # the bucket up front, reading the buckets from file if needed
+            adj_picks = adj_buckets.sample(bucket, count, rng)
+            noun_picks = noun_buckets.sample(bucket, count, rng)
+            for (_, adj_info), (noun, noun_info) in zip(adj_picks, noun_picks):
+                gender = noun_info["gender"]
+                noun_ft = noun_info["variants"]["ft"]
+                # Use the base strong forms of the adjective for the correct gender
+                adj_forms = adj_info["variants"][gender]
+                adj, adj_ft = adj_forms["et"], adj_forms["ft"]
                 # Create the complete inflection JSON record
-                completion = {
-                    "et": {  # Singular
-                        "nf": f"{nl:nf}",  # Nominative
-                        "þf": f"{nl:þf}",  # Accusative
-                        "þgf": f"{nl:þgf}",  # Dative
-                        "ef": f"{nl:ef}",  # Genitive
-                    },
-                    "ft": {  # Plural
-                        "nf": f"{nl_ft:nf}",
-                        "þf": f"{nl_ft:þf}",
-                        "þgf": f"{nl_ft:þgf}",
-                        "ef": f"{nl_ft:ef}",
-                    },
-                }
+                completion = build_completion(adj, adj_ft, noun, noun_ft)
+                # Write the JSONL record to the output file
                 example = {
                     "input": [
                         {
@@ -327,7 +551,6 @@ def generate(count: int) -> None:
                     "ideal": jdump(completion),
                 }
                 out.write(f"{jdump(example)}\n")
-                c += 1
 
 
 if __name__ == "__main__":
@@ -349,11 +572,17 @@ if __name__ == "__main__":
         metavar="N",
         help="generate JSONL output files with N samples per bucket (default: 10)",
     )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=RANDOM_SEED,
+        help=f"random seed for generating the samples (default: {RANDOM_SEED})",
+    )
     args = parser.parse_args()
 
     if args.generate:
         # Generate JSONL output files
-        generate(args.generate)
+        generate(args.generate, args.seed)
     elif args.nouns:
         # Nouns only
         process_nouns()